@@ -6,8 +6,6 @@ import boxen from "boxen";
 import dotenv from "dotenv";
 import fs from 'fs';
 import { OpenAI } from 'openai';
-import fetch from 'node-fetch';
-import path from "path";
 import WebSocket from "ws";
 
 dotenv.config();
@@ -23,6 +21,9 @@ const logger = console; // Simple console logger for TypeScript
 // Cartesia STT via OpenAI-compatible API
 // ------------------------------------------------------------
 
+// STT model used by both the streaming socket and batch transcription
+const CARTESIA_STT_MODEL = process.env.CARTESIA_STT_MODEL || "ink-whisper";
+
 /**
  * Transcribe an audio file using Cartesia Ink Whisper model.
  * Returns the transcribed text.
@@ -42,7 +43,7 @@ async function transcribeWithCartesia(filePath: string): Promise<string> {
 
     const response: any = await client.audio.transcriptions.create({
       file: fs.createReadStream(filePath) as any,
-      model: "ink-whisper",
+      model: CARTESIA_STT_MODEL,
       language: "en",
       timestamp_granularities: ["word"],
     } as any);
@@ -136,6 +137,20 @@ async function executeAction(commandText: string, page: Page) {
     }
 }
 
+/**
+ * Smooth-scroll the page by a fraction of the viewport height.
+ * @param fraction - Positive scrolls down, negative scrolls up.
+ */
+async function scrollByViewport(page: Page, fraction: number) {
+    await page.evaluate((f) => {
+        window.scrollBy({
+            top: window.innerHeight * f,
+            left: 0,
+            behavior: 'smooth'
+        });
+    }, fraction);
+}
+
 /**
  * Combine all steps of voice command handling:
  * 1. Record
@@ -149,7 +164,7 @@ async function handleVoiceCommand(page: Page, audioFilePath = "command.mp3") {
         await recordAudio(audioFilePath);
 
         // 2. Transcribe Audio
-        const transcribedText = await transcribeAudio(audioFilePath);
+        const transcribedText = await transcribeWithCartesia(audioFilePath);
         console.log(transcribedText)
 
         
@@ -258,19 +273,40 @@ async function classifyCommand(transcript: string): Promise<'1' | '2' | '3'> {
   }
 }
 
+// Audio is coalesced into ~100 ms sends to cut per-message WebSocket overhead;
+// a partly filled send goes out once it has waited this long.
+const SEND_BYTES = 3200; // 100 ms of 16 kHz s16le mono
+const SEND_FLUSH_MS = 100;
+// Identical final transcripts arriving this close together are one utterance
+const DUPLICATE_FINAL_WINDOW_MS = 1000;
+
 /**
- * Placeholder for the new Node-only push-to-talk loop that will use Cartesia.
- * For now it just logs a message so the application can run without Python.
+ * Stream microphone audio to Cartesia's streaming STT and act on each final
+ * transcript: scroll commands run directly, "exit"/"quit"/"stop" shuts down,
+ * and anything else is passed to Stagehand. Resolves once shut down.
+ * @param page - The Stagehand (Playwright) page object.
+ * @param stagehand - The Stagehand instance, closed on shutdown.
+ * @param pageReady - Settles when the initial navigation is done. The socket and
+ * mic start immediately, but transcripts wait on this before acting on the page.
  */
-function startStreamingVoiceLoop(page: Page, stagehand: Stagehand): Promise<void> {
+function startStreamingVoiceLoop(
+  page: Page,
+  stagehand: Stagehand,
+  pageReady: Promise<unknown> = Promise.resolve(),
+): Promise<void> {
   return new Promise(async (resolve) => {
     const apiKey = process.env.CARTESIA_API_KEY;
     if (!apiKey) {
       throw new Error("CARTESIA_API_KEY not set");
     }
 
+    // Load the recorder module while the WebSocket handshake is in flight so the
+    // mic can start as soon as the socket opens.
+    const recorderModule = loadAudioRecorder();
+    recorderModule.catch(() => {}); // surfaced when awaited in the open handler
+
     const qs = new URLSearchParams({
-      model: "ink-whisper",
+      model: CARTESIA_STT_MODEL,
       encoding: "pcm_s16le",
       sample_rate: "16000",
     }).toString();
@@ -282,10 +318,30 @@ function startStreamingVoiceLoop(page: Page, stagehand: Stagehand): Promise<void
       },
     });
 
+    let recorder: any = null;
+    let flushAudio: (() => void) | null = null;
+    let shuttingDown = false;
+
+    // Single, idempotent exit path shared by Ctrl+C and the voice exit command
+    async function shutdown() {
+      if (shuttingDown) return;
+      recorder?.stop();
+      flushAudio?.(); // send the buffered tail of speech before finalizing
+      shuttingDown = true;
+      if (ws.readyState === WebSocket.OPEN) {
+        ws.send("finalize");
+        ws.send("done");
+      }
+      ws.close();
+      await stagehand.close();
+      resolve();
+      process.exit(0);
+    }
+
     ws.on("open", async () => {
       console.log(chalk.yellow("🎤 Cartesia streaming STT connected. Speak freely (Ctrl+C to exit)"));
 
-      const AudioRecorder = await loadAudioRecorder();
+      const AudioRecorder = await recorderModule;
       const recorderOptions = {
         program: "rec",
         device: null,
@@ -297,12 +353,50 @@ function startStreamingVoiceLoop(page: Page, stagehand: Stagehand): Promise<void
         silence: 0,
       };
 
-      const recorder = new AudioRecorder(recorderOptions, console);
+      recorder = new AudioRecorder(recorderOptions, console);
       const micStream = recorder.start().stream();
 
+      // Coalesce small recorder chunks into ~100 ms sends; chunks that already
+      // fill a send go out as-is. The socket carries a raw s16le stream, so only
+      // whole samples matter: an odd trailing byte is carried over to the next send.
+      const sendBuffer = Buffer.allocUnsafe(SEND_BYTES);
+      let buffered = 0;
+      let flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+      const flush = () => {
+        if (flushTimer) {
+          clearTimeout(flushTimer);
+          flushTimer = null;
+        }
+        if (shuttingDown || ws.readyState !== WebSocket.OPEN) {
+          buffered = 0;
+          return;
+        }
+        const whole = buffered & ~1;
+        if (whole === 0) return;
+        ws.send(Buffer.from(sendBuffer.subarray(0, whole)), { binary: true });
+        sendBuffer.copy(sendBuffer, 0, whole, buffered);
+        buffered -= whole;
+      };
+
       micStream.on("data", (chunk: Buffer) => {
-        ws.send(chunk, { binary: true });
+        if (shuttingDown || ws.readyState !== WebSocket.OPEN) return;
+        if (buffered === 0 && chunk.length >= SEND_BYTES && chunk.length % 2 === 0) {
+          ws.send(chunk, { binary: true });
+          return;
+        }
+        let offset = 0;
+        while (offset < chunk.length) {
+          const copied = chunk.copy(sendBuffer, buffered, offset);
+          buffered += copied;
+          offset += copied;
+          if (buffered === SEND_BYTES) flush();
+        }
+        if (buffered > 0 && !flushTimer) {
+          flushTimer = setTimeout(flush, SEND_FLUSH_MS);
+        }
       });
+      flushAudio = flush;
 
       // Handle Ctrl+C for graceful shutdown
       process.stdin.setRawMode(true);
@@ -310,61 +404,41 @@ function startStreamingVoiceLoop(page: Page, stagehand: Stagehand): Promise<void
       process.stdin.on("data", async (key) => {
         if (key === "\u0003") {
           console.log(chalk.green("👋 Shutting down…"));
-          recorder.stop();
-          ws.send("finalize");
-          ws.send("done");
-          ws.close();
-          await stagehand.close();
-          resolve();
-          process.exit(0);
+          await shutdown();
         }
       });
     });
 
+    let lastFinal = "";
+    let lastFinalAt = 0;
+
     async function handleTranscript(text: string) {
-      const trimmed = text.trim();
-      if (trimmed.length < 4) return;     // ignore empty or 1-3 char fragments
+      const lower = text.toLowerCase();
 
-      const lower = trimmed.toLowerCase();
-      
-      // Handle explicit scroll commands first
+      // Handle exit commands
+      if (["exit", "quit", "stop"].includes(lower)) {
+        console.log(chalk.green("👋 Voice exit detected – shutting down."));
+        await shutdown();
+        return;
+      }
+
+      await pageReady; // page commands only run once the initial navigation settles
+
+      // Handle explicit scroll commands
       if (lower.includes('scroll down')) {
-        console.log(chalk.yellow('Scrolling down 30vh…'));
-        await page.evaluate(() => {
-          window.scrollBy({
-            top: window.innerHeight * 0.6,
-            left: 0,
-            behavior: 'smooth'
-          });
-        });
+        console.log(chalk.yellow('Scrolling down 60vh…'));
+        await scrollByViewport(page, 0.6);
         return;
       }
       if (lower.includes('scroll up')) {
         console.log(chalk.yellow('Scrolling up 30vh…'));
-        await page.evaluate(() => {
-          window.scrollBy({
-            top: -window.innerHeight * 0.3,
-            left: 0,
-            behavior: 'smooth'
-          });
-        });
+        await scrollByViewport(page, -0.3);
         return;
       }
       
-      // Handle exit commands
-      if (["exit", "quit", "stop"].includes(lower)) {
-        console.log(chalk.green("👋 Voice exit detected – shutting down."));
-        ws.send("finalize");
-        ws.send("done");
-        ws.close();
-        await stagehand.close();
-        resolve();
-        process.exit(0);
-      }
-      
       // For other commands, skip classification and execute directly with Stagehand
-      console.log(chalk.cyan("🎯 Executing Stagehand action:"), trimmed);
-      await executeAction(trimmed, page);
+      console.log(chalk.cyan("🎯 Executing Stagehand action:"), text);
+      await executeAction(text, page);
     }
 
     ws.on("message", async (data) => {
@@ -377,12 +451,18 @@ function startStreamingVoiceLoop(page: Page, stagehand: Stagehand): Promise<void
       }
 
       if (msg.type === "transcript" && msg.is_final) {
-        // Extract text from words array or use text field
-        const text = msg.words?.map((word: any) => word.word).join('') || msg.text || '';
-        if (text.trim().length >= 4) {
-          console.log(chalk.green("🎯 Final transcript:"), text);
-          await handleTranscript(text);
-        }
+        // Use the text field, only re-joining the words array when it is missing
+        const text = (msg.text || msg.words?.map((word: any) => word.word).join('') || '').trim();
+        if (text.length < 4) return;
+
+        // Drop a repeated finalization of the same utterance
+        const now = Date.now();
+        if (text === lastFinal && now - lastFinalAt < DUPLICATE_FINAL_WINDOW_MS) return;
+        lastFinal = text;
+        lastFinalAt = now;
+
+        console.log(chalk.green("🎯 Final transcript:"), text);
+        await handleTranscript(text);
       }
     });
 
@@ -408,9 +488,12 @@ async function main({
   console.log(chalk.cyan("🎭 Stagehand Voice Browser"));
   console.log(chalk.yellow("🚀 Say commands; they'll be executed automatically.\n"));
 
-  await page.goto("https://www.google.com");
+  // Navigate while the STT socket and mic come up instead of before them
+  const navigation = page
+    .goto("https://www.google.com")
+    .catch((err) => console.error(chalk.red("Navigation failed:"), err));
 
-  await startStreamingVoiceLoop(page, stagehand);
+  await startStreamingVoiceLoop(page, stagehand, navigation);
 }
 
 /**
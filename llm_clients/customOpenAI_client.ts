@@ -42,11 +42,21 @@ function validateZodSchema(schema: z.ZodTypeAny, data: unknown) {
 export class CustomOpenAIClient extends LLMClient {
   public type = "openai" as const;
   private client: OpenAI;
+  private verbose: number;
 
-  constructor({ modelName, client }: { modelName: string; client: OpenAI }) {
+  constructor({
+    modelName,
+    client,
+    verbose = 0,
+  }: {
+    modelName: string;
+    client: OpenAI;
+    verbose?: number; // 0 = silent, 1 = request/response summary, 2 = also full bodies
+  }) {
     super(modelName as AvailableModel);
     this.client = client;
     this.modelName = modelName as AvailableModel;
+    this.verbose = verbose;
   }
 
   async createChatCompletion<T = ChatCompletion>({
@@ -190,25 +200,39 @@ export class CustomOpenAIClient extends LLMClient {
       })),
     };
 
-    // Log the exact request being sent to Cerebras
-    console.log(chalk.blue("🚀 Sending request to Cerebras API:"));
-    console.log(chalk.cyan("📤 Request Body:"));
-    console.log(JSON.stringify(body, null, 2));
-    console.log(chalk.cyan("🔗 API Endpoint:") + " " + this.client.baseURL);
-    console.log(chalk.cyan("🤖 Model:") + " " + this.modelName);
-    console.log("");
+    // Log the exact request being sent to Cerebras (compact JSON, one write)
+    if (this.verbose >= 1) {
+      console.log(
+        [
+          chalk.blue("🚀 Sending request to Cerebras API:"),
+          ...(this.verbose >= 2
+            ? [chalk.cyan("📤 Request Body:"), JSON.stringify(body)]
+            : []),
+          chalk.cyan("🔗 API Endpoint:") + " " + this.client.baseURL,
+          chalk.cyan("🤖 Model:") + " " + this.modelName,
+          "",
+        ].join("\n"),
+      );
+    }
 
     const response = await this.client.chat.completions.create(body);
 
     // Log the response from Cerebras
-    console.log(chalk.green("✅ Received response from Cerebras API:"));
-    console.log(chalk.cyan("📥 Response:"));
-    console.log(JSON.stringify(response, null, 2));
-    console.log(chalk.cyan("⏱️  Usage:"));
-    console.log(`  Prompt tokens: ${response.usage?.prompt_tokens || 0}`);
-    console.log(`  Completion tokens: ${response.usage?.completion_tokens || 0}`);
-    console.log(`  Total tokens: ${response.usage?.total_tokens || 0}`);
-    console.log("");
+    if (this.verbose >= 1) {
+      console.log(
+        [
+          chalk.green("✅ Received response from Cerebras API:"),
+          ...(this.verbose >= 2
+            ? [chalk.cyan("📥 Response:"), JSON.stringify(response)]
+            : []),
+          chalk.cyan("⏱️  Usage:"),
+          `  Prompt tokens: ${response.usage?.prompt_tokens || 0}`,
+          `  Completion tokens: ${response.usage?.completion_tokens || 0}`,
+          `  Total tokens: ${response.usage?.total_tokens || 0}`,
+          "",
+        ].join("\n"),
+      );
+    }
 
     logger({
       category: "openai",
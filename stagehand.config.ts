@@ -6,13 +6,21 @@ import { OpenAI } from "openai";
 
 dotenv.config();
 
+// Verbosity level for logging: 0 = silent, 1 = info, 2 = all (includes full LLM
+// request/response bodies). Override with STAGEHAND_VERBOSE; anything other
+// than 0, 1 or 2 falls back to 0.
+const requestedVerbose = Number(process.env.STAGEHAND_VERBOSE);
+const verbose: 0 | 1 | 2 =
+  requestedVerbose === 1 || requestedVerbose === 2 ? requestedVerbose : 0;
+
 const StagehandConfig: ConstructorParams = {
-  verbose: 0 /* Verbosity level for logging: 0 = silent, 1 = info, 2 = all */,
+  verbose,
   domSettleTimeoutMs: 30_000 /* Further reduced timeout for DOM to settle in milliseconds */,
 
   // LLM configuration
   llmClient: new CustomOpenAIClient({
     modelName: "llama-3.3-70b", // better models work better
+    verbose,
     client: new OpenAI({
       baseURL: "https://api.cerebras.ai/v1",
       apiKey: process.env.CEREBRAS_API_KEY!,